@@ -1,4 +1,5 @@
 import argparse
+import concurrent.futures
 import datetime
 import json
 import math
@@ -10,8 +11,10 @@ import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from typing import Optional
+import uuid
+from typing import Callable, Iterable, Iterator, Optional
 
 from pydantic import BaseModel, Field
 
@@ -21,9 +24,22 @@ except ImportError:  # pragma: no cover - depends on local environment
     dotenv = None
 
 try:
-    from openai import APITimeoutError, OpenAI
+    import httpx
+except ImportError:  # pragma: no cover - depends on local environment
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+except ImportError:  # pragma: no cover - depends on local environment
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+try:
+    from openai import APITimeoutError, DefaultHttpxClient, OpenAI
 except ImportError:  # pragma: no cover - depends on local environment
     APITimeoutError = Exception
+    DefaultHttpxClient = None
     OpenAI = None
 
 from cill.shared import (
@@ -37,16 +53,23 @@ from cill.shared import (
 if dotenv is not None:
     dotenv.load_dotenv()
 
+
 REQUEST_TIMEOUT_SECONDS = 300
-MAX_RETRIES = 1
+DEFAULT_MAX_RETRIES = 1
 RETRY_BACKOFF_SECONDS = 5
+MAX_CONCURRENT_CHUNK_REQUESTS = 4
+HTTP_MAX_CONNECTIONS = 16
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 120.0
 DEFAULT_MODEL_NAME = "gpt-4o-transcribe"
 DIARIZE_MODEL_NAME = "gpt-4o-transcribe-diarize"
 SUMMARY_MODEL_NAME = "gpt-4.1-mini"
 
 MAX_MODEL_DURATION_SECONDS = 1400
-CHUNK_TARGET_DURATION_SECONDS = 900
-CHUNK_OVERLAP_SECONDS = 5
+DEFAULT_CHUNK_TARGET_DURATION_SECONDS = 900
+DEFAULT_CHUNK_OVERLAP_SECONDS = 5
+CHUNK_BOUNDARY_TOLERANCE_SECONDS = 0.3
+MIN_OVERLAP_WORDS = 2
+MAX_OVERLAP_WORDS = 40
 
 SOURCES_DIR = "./sources"
 YOUTUBE_SOURCES_DIR = os.path.join(SOURCES_DIR, "youtube")
@@ -66,12 +89,60 @@ SUPPORTED_SOURCE_EXTENSIONS = {
     ".mov",
     ".ts",
 }
+SUPPORTED_SOURCE_SUFFIXES = tuple(sorted(SUPPORTED_SOURCE_EXTENSIONS))
 DIRECT_AUDIO_EXTENSIONS = {".mp3", ".opus", ".wav", ".m4a", ".aac", ".flac", ".ogg"}
+TRANSCODE_AUDIO_BITRATE = "24k"
+COPYABLE_AUDIO_CODECS = {"aac": ".m4a", "opus": ".ogg", "mp3": ".mp3"}
+UPLOAD_EXTENSION_ALIASES = {".opus": ".ogg"}
+AUDIO_MIME_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".aac": "audio/aac",
+    ".flac": "audio/flac",
+    ".ogg": "audio/ogg",
+    ".webm": "audio/webm",
+}
 
 YOUTUBE_UPCOMING_STATUSES = {"is_upcoming"}
 YOUTUBE_ACTIVE_LIVE_STATUSES = {"is_live"}
 VERBOSE = False
 
+_duration_cache: dict[tuple[str, int, int], float] = {}
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def read_int_setting(name: str, default: int, minimum: int, maximum: Optional[int] = None) -> int:
+    raw_value = os.getenv(name, "").strip()
+    if not raw_value:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        print(f"Warning: {name}={raw_value!r} is not a whole number; using {default}.")
+        return default
+    if value < minimum or (maximum is not None and value > maximum):
+        allowed = f"{minimum}-{maximum}" if maximum is not None else f"{minimum} or more"
+        print(f"Warning: {name}={value} is outside the allowed range ({allowed}); using {default}.")
+        return default
+    return value
+
+
+MAX_RETRIES = read_int_setting("SPEECH_MAX_RETRIES", DEFAULT_MAX_RETRIES, minimum=1)
+CHUNK_TARGET_DURATION_SECONDS = read_int_setting(
+    "SPEECH_CHUNK_TARGET_DURATION_SECONDS",
+    DEFAULT_CHUNK_TARGET_DURATION_SECONDS,
+    minimum=1,
+    maximum=MAX_MODEL_DURATION_SECONDS,
+)
+CHUNK_OVERLAP_SECONDS = read_int_setting(
+    "SPEECH_CHUNK_OVERLAP_SECONDS",
+    min(DEFAULT_CHUNK_OVERLAP_SECONDS, CHUNK_TARGET_DURATION_SECONDS - 1),
+    minimum=0,
+    maximum=CHUNK_TARGET_DURATION_SECONDS - 1,
+)
+
 
 class SummaryPayload(BaseModel):
     overview: str = Field(description="A concise 2-4 sentence overview of the transcript.")
@@ -137,9 +208,9 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def log_verbose(message: str) -> None:
+def log_verbose(message: str, report: Callable[[str], None] = print) -> None:
     if VERBOSE:
-        print(f"[verbose] {message}")
+        report(f"[verbose] {message}")
 
 
 def format_command(command: list[str]) -> str:
@@ -212,13 +283,48 @@ def get_openai_api_key() -> str:
     return api_key
 
 
+def get_http_client():
+    global _http_client
+    if httpx is None or DefaultHttpxClient is None:
+        return None
+    with _http_client_lock:
+        if _http_client is None:
+            log_verbose(f"Creating shared HTTP client (http2={HTTP2_AVAILABLE})")
+            _http_client = DefaultHttpxClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+        return _http_client
+
+
 def get_openai_client() -> OpenAI:
     if OpenAI is None:
         print("Error: openai is not installed. Install dependencies with: pip install -r requirements.txt")
         sys.exit(1)
     api_key = get_openai_api_key()
     log_verbose("Creating OpenAI client")
-    return OpenAI(api_key=api_key, timeout=REQUEST_TIMEOUT_SECONDS)
+    return OpenAI(api_key=api_key, timeout=REQUEST_TIMEOUT_SECONDS, http_client=get_http_client())
+
+
+def warm_openai_connection() -> Optional[threading.Thread]:
+    if OpenAI is None or not (os.getenv("OPENAI_API_KEY") or "").strip():
+        return None
+
+    def warm() -> None:
+        try:
+            get_openai_client().models.list()
+            log_verbose("Pre-warmed OpenAI connection pool")
+        except Exception as exc:  # pragma: no cover - network dependent
+            log_verbose(f"OpenAI connection pre-warm failed: {exc}")
+
+    thread = threading.Thread(target=warm, name="openai-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 
 def ensure_command_available(command_name: str, install_hint: str) -> str:
@@ -231,7 +337,22 @@ def ensure_command_available(command_name: str, install_hint: str) -> str:
 
 
 def is_supported_local_source(file_name: str) -> bool:
-    return os.path.splitext(file_name)[1].lower() in SUPPORTED_SOURCE_EXTENSIONS
+    return file_name.lower().endswith(SUPPORTED_SOURCE_SUFFIXES)
+
+
+def iter_source_file_entries(sources_dir: str) -> Iterator[os.DirEntry]:
+    pending_dirs = [sources_dir]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError as exc:
+            log_verbose(f"Skipping unreadable sources directory {current_dir}: {exc}")
 
 
 def get_audio_files_from_sources(sources_dir: str = SOURCES_DIR) -> list[tuple[str, float]]:
@@ -240,13 +361,11 @@ def get_audio_files_from_sources(sources_dir: str = SOURCES_DIR) -> list[tuple[s
         sys.exit(1)
 
     files: list[tuple[str, float]] = []
-    for root, _, filenames in os.walk(sources_dir):
-        for filename in filenames:
-            if not is_supported_local_source(filename):
-                continue
-            file_path = os.path.join(root, filename)
-            relative_path = os.path.relpath(file_path, sources_dir)
-            files.append((relative_path, os.path.getmtime(file_path)))
+    for entry in iter_source_file_entries(sources_dir):
+        if not is_supported_local_source(entry.name):
+            continue
+        relative_path = os.path.relpath(entry.path, sources_dir)
+        files.append((relative_path, entry.stat().st_mtime))
 
     if not files:
         print("No audio or video files found in sources folder")
@@ -317,13 +436,28 @@ def prompt_optional_max_duration_minutes() -> Optional[float]:
 
 def format_timestamp(seconds: float) -> str:
     total_ms = int(seconds * 1000)
-    hours, remainder = divmod(total_ms, 3_600_000)
-    minutes, remainder = divmod(remainder, 60_000)
-    seconds_fraction = remainder / 1000
-    return f"{hours:02d}:{minutes:02d}:{seconds_fraction:06.3f}"
+    return "%02d:%02d:%06.3f" % (total_ms // 3_600_000, (total_ms // 60_000) % 60, (total_ms % 60_000) / 1000)
 
 
-def get_audio_duration(audio_path: str) -> float:
+def get_audio_duration(audio_path: str, report: Callable[[str], None] = print) -> float:
+    try:
+        stat_result = os.stat(audio_path)
+    except OSError:
+        cache_key = None
+    else:
+        cache_key = (os.path.abspath(audio_path), stat_result.st_mtime_ns, stat_result.st_size)
+        cached_duration = _duration_cache.get(cache_key)
+        if cached_duration is not None:
+            log_verbose(f"Reusing cached audio duration for {audio_path}: {cached_duration:.2f}s", report=report)
+            return cached_duration
+
+    duration = probe_audio_duration(audio_path, report=report)
+    if cache_key is not None:
+        _duration_cache[cache_key] = duration
+    return duration
+
+
+def probe_audio_duration(audio_path: str, report: Callable[[str], None] = print) -> float:
     try:
         command = [
             "ffprobe",
@@ -335,119 +469,255 @@ def get_audio_duration(audio_path: str) -> float:
             "default=noprint_wrappers=1:nokey=1",
             audio_path,
         ]
-        log_verbose(f"Running ffprobe: {format_command(command)}")
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        log_verbose(f"Running ffprobe: {format_command(command)}", report=report)
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
         duration = float(result.stdout.strip())
-        log_verbose(f"Audio duration for {audio_path}: {duration:.2f}s")
+        log_verbose(f"Audio duration for {audio_path}: {duration:.2f}s", report=report)
         return duration
     except subprocess.CalledProcessError as exc:
-        print(f"Error determining duration with ffprobe: {exc}")
+        report(f"Error determining duration with ffprobe: {exc}")
         sys.exit(1)
     except ValueError:
-        print("Unable to parse audio duration.")
+        report("Unable to parse audio duration.")
         sys.exit(1)
     except FileNotFoundError:
-        print("Error: ffprobe is not installed. Please install ffmpeg suite first.")
+        report("Error: ffprobe is not installed. Please install ffmpeg suite first.")
         sys.exit(1)
 
 
-def convert_media_to_mp3(media_path: str) -> str:
-    base_name, _ = os.path.splitext(media_path)
-    output_path = f"{base_name}.mp3"
+def get_audio_codec(media_path: str, report: Callable[[str], None] = print) -> Optional[str]:
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=codec_name",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        media_path,
+    ]
+    log_verbose(f"Running ffprobe codec probe: {format_command(command)}", report=report)
+    try:
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError) as exc:
+        log_verbose(f"Unable to probe audio codec for {media_path}: {exc}", report=report)
+        return None
 
-    if os.path.exists(output_path) and os.path.getmtime(output_path) >= os.path.getmtime(media_path):
-        print(f"Reusing extracted audio: {output_path}")
-        log_verbose(f"Skipping ffmpeg conversion because extracted audio is up to date: {output_path}")
-        return output_path
+    codec_name = result.stdout.strip().lower()
+    log_verbose(f"Audio codec for {media_path}: {codec_name or 'unknown'}", report=report)
+    return codec_name or None
 
-    try:
-        command = [
+
+def build_audio_extraction_command(media_path: str, codec_name: Optional[str]) -> tuple[list[str], str]:
+    base_name, _ = os.path.splitext(media_path)
+    copy_extension = COPYABLE_AUDIO_CODECS.get(codec_name or "")
+    if copy_extension:
+        output_path = f"{base_name}{copy_extension}"
+        return [
             "ffmpeg",
+            "-nostdin",
+            "-v",
+            "error",
             "-y",
             "-i",
             media_path,
             "-vn",
-            "-q:a",
-            "2",
+            "-c:a",
+            "copy",
             output_path,
-        ]
-        log_verbose(f"Running ffmpeg audio extraction: {format_command(command)}")
-        subprocess.run(command, check=True, capture_output=True)
-        print(f"Audio extracted: {output_path}")
+        ], output_path
+
+    output_path = f"{base_name}.ogg"
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-v",
+        "error",
+        "-y",
+        "-i",
+        media_path,
+        "-vn",
+        "-ac",
+        "1",
+        "-c:a",
+        "libopus",
+        "-b:a",
+        TRANSCODE_AUDIO_BITRATE,
+        "-application",
+        "voip",
+        output_path,
+    ], output_path
+
+
+def extract_audio_from_media(media_path: str, report: Callable[[str], None] = print) -> str:
+    command, output_path = build_audio_extraction_command(media_path, get_audio_codec(media_path, report=report))
+
+    if os.path.exists(output_path) and os.path.getmtime(output_path) >= os.path.getmtime(media_path):
+        report(f"Reusing extracted audio: {output_path}")
+        log_verbose(f"Skipping ffmpeg extraction because extracted audio is up to date: {output_path}", report=report)
+        return output_path
+
+    try:
+        log_verbose(f"Running ffmpeg audio extraction: {format_command(command)}", report=report)
+        subprocess.run(
+            command,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        report(f"Audio extracted: {output_path}")
         return output_path
     except subprocess.CalledProcessError as exc:
-        print(f"Error extracting audio: {exc}")
+        stderr = exc.stderr.strip() if exc.stderr else str(exc)
+        report(f"Error extracting audio: {stderr}")
         sys.exit(1)
     except FileNotFoundError:
-        print("Error: ffmpeg is not installed. Please install it first.")
+        report("Error: ffmpeg is not installed. Please install it first.")
         sys.exit(1)
 
 
-def ensure_audio_file(media_path: str) -> str:
+def ensure_audio_file(media_path: str, report: Callable[[str], None] = print) -> str:
     extension = os.path.splitext(media_path)[1].lower()
     if extension in DIRECT_AUDIO_EXTENSIONS:
         return media_path
-    return convert_media_to_mp3(media_path)
+    return extract_audio_from_media(media_path, report=report)
 
 
-def split_audio_file(
+def prepare_audio_file(media_path: str, report: Callable[[str], None] = print) -> str:
+    audio_file_path = ensure_audio_file(media_path, report=report)
+    get_audio_duration(audio_file_path, report=report)
+    return audio_file_path
+
+
+def start_audio_preparation(media_path: str) -> tuple[concurrent.futures.Future, list[str]]:
+    # Messages are held back until finish_audio_preparation so they do not
+    # interleave with interactive prompts shown while the work runs.
+    messages: list[str] = []
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-prep")
+    future = executor.submit(prepare_audio_file, media_path, messages.append)
+    executor.shutdown(wait=False)
+    log_verbose(f"Started background audio preparation for {media_path}")
+    return future, messages
+
+
+def finish_audio_preparation(preparation: tuple[concurrent.futures.Future, list[str]]) -> str:
+    future, messages = preparation
+    try:
+        return future.result()
+    finally:
+        for message in messages:
+            print(message)
+
+
+def plan_audio_chunks(
     audio_path: str,
+    output_dir: str,
+    total_duration: float,
     segment_length: int = CHUNK_TARGET_DURATION_SECONDS,
     overlap: int = CHUNK_OVERLAP_SECONDS,
-) -> tuple[str, list[tuple[str, float]]]:
+) -> list[tuple[str, float, float]]:
     if overlap >= segment_length:
         raise ValueError("Overlap must be smaller than segment length.")
 
-    temp_dir = tempfile.mkdtemp(prefix="segments_", dir=os.getcwd())
     base_name, ext = os.path.splitext(os.path.basename(audio_path))
-    total_duration = get_audio_duration(audio_path)
     step = segment_length - overlap
+    plan: list[tuple[str, float, float]] = []
+
+    index = 0
+    start = 0.0
+    while start < total_duration:
+        duration = min(segment_length, total_duration - start)
+        output_file = os.path.join(output_dir, f"{base_name}_part_{index:03d}{ext}")
+        plan.append((output_file, start, duration))
+        # Any further chunk would lie wholly inside this chunk's overlap.
+        if start + duration >= total_duration:
+            break
+        index += 1
+        start = float(index * step)
+
+    return plan
 
-    offsets: list[tuple[str, float]] = []
+
+def build_chunk_command(audio_path: str, output_file: str, start: float, duration: float) -> list[str]:
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-v",
+        "error",
+        "-ss",
+        str(start),
+        "-t",
+        str(duration),
+        "-i",
+        audio_path,
+        "-c",
+        "copy",
+        "-map",
+        "0",
+        "-avoid_negative_ts",
+        "1",
+        output_file,
+    ]
+
+
+def iter_audio_chunks(
+    audio_path: str,
+    temp_dir: str,
+    plan: list[tuple[str, float, float]],
+) -> Iterator[tuple[str, float]]:
+    for index, (output_file, start, duration) in enumerate(plan):
+        command = build_chunk_command(audio_path, output_file, start, duration)
+        log_verbose(f"Creating chunk {index} from {start:.1f}s for {duration:.1f}s: {format_command(command)}")
+        try:
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        except subprocess.CalledProcessError as exc:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            stderr = exc.stderr.strip() if exc.stderr else str(exc)
+            print(f"Error splitting audio: {stderr}")
+            sys.exit(1)
+        except FileNotFoundError:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            print("Error: ffmpeg is not installed. Please install it first.")
+            sys.exit(1)
+
+        if not os.path.exists(output_file):
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            print("Failed to create audio chunks.")
+            sys.exit(1)
+
+        yield output_file, start
+
+
+def split_audio_file(
+    audio_path: str,
+    total_duration: float,
+    segment_length: int = CHUNK_TARGET_DURATION_SECONDS,
+    overlap: int = CHUNK_OVERLAP_SECONDS,
+) -> tuple[str, Iterator[tuple[str, float]]]:
+    temp_dir = tempfile.mkdtemp(prefix="segments_", dir=os.getcwd())
     try:
-        index = 0
-        start = 0.0
-        while start < total_duration:
-            duration = min(segment_length, total_duration - start)
-            output_file = os.path.join(temp_dir, f"{base_name}_part_{index:03d}{ext}")
-            command = [
-                "ffmpeg",
-                "-ss",
-                str(start),
-                "-t",
-                str(duration),
-                "-i",
-                audio_path,
-                "-c",
-                "copy",
-                "-map",
-                "0",
-                "-avoid_negative_ts",
-                "1",
-                output_file,
-            ]
-            log_verbose(
-                f"Creating chunk {index} from {start:.1f}s for {duration:.1f}s: {format_command(command)}"
-            )
-            subprocess.run(command, check=True, capture_output=True)
-            offsets.append((output_file, start))
-            index += 1
-            start += step
-    except subprocess.CalledProcessError as exc:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        print(f"Error splitting audio: {exc}")
-        sys.exit(1)
-    except FileNotFoundError:
+        plan = plan_audio_chunks(
+            audio_path,
+            temp_dir,
+            total_duration,
+            segment_length=segment_length,
+            overlap=overlap,
+        )
+    except ValueError:
         shutil.rmtree(temp_dir, ignore_errors=True)
-        print("Error: ffmpeg is not installed. Please install it first.")
-        sys.exit(1)
+        raise
 
-    if not offsets:
+    if not plan:
         shutil.rmtree(temp_dir, ignore_errors=True)
         print("Failed to create audio chunks.")
         sys.exit(1)
 
-    return temp_dir, offsets
+    log_verbose(f"Planned {len(plan)} chunk(s); each is cut just before it is submitted for transcription")
+    return temp_dir, iter_audio_chunks(audio_path, temp_dir, plan)
 
 
 def prompt_youtube_url() -> str:
@@ -851,8 +1121,21 @@ def print_youtube_metadata_summary(metadata: dict, live_status: str) -> None:
     print(f"Live status: {live_status}")
 
 
-def transcribe_chunk_with_retry(chunk_path: str, language_hint: Optional[str], diarize: bool):
-    client = get_openai_client()
+def build_upload_file(chunk_path: str, audio_file) -> tuple:
+    base_name, extension = os.path.splitext(os.path.basename(chunk_path))
+    extension = UPLOAD_EXTENSION_ALIASES.get(extension.lower(), extension.lower())
+    mime_type = AUDIO_MIME_TYPES.get(extension, "application/octet-stream")
+    return f"{base_name}{extension}", audio_file, mime_type
+
+
+def transcribe_chunk_with_retry(
+    chunk_path: str,
+    language_hint: Optional[str],
+    diarize: bool,
+    client: Optional[OpenAI] = None,
+):
+    if client is None:
+        client = get_openai_client()
     last_error = None
     model_name = get_model_name(diarize)
 
@@ -874,7 +1157,10 @@ def transcribe_chunk_with_retry(chunk_path: str, language_hint: Optional[str], d
             )
 
             with open(chunk_path, "rb") as audio_file:
-                return client.audio.transcriptions.create(file=audio_file, **request_kwargs)
+                return client.audio.transcriptions.create(
+                    file=build_upload_file(chunk_path, audio_file),
+                    **request_kwargs,
+                )
         except APITimeoutError as exc:  # pragma: no cover - network dependent
             last_error = exc
             if attempt == MAX_RETRIES:
@@ -893,6 +1179,52 @@ def transcribe_chunk_with_retry(chunk_path: str, language_hint: Optional[str], d
     raise last_error
 
 
+def start_daemon_task(function, *args) -> concurrent.futures.Future:
+    # ThreadPoolExecutor joins its workers at interpreter exit, so an upload that
+    # is abandoned after a failure or Ctrl+C would still hold the process open.
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(function(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="chunk-upload", daemon=True).start()
+    return future
+
+
+def raise_first_chunk_error(futures: Iterable[concurrent.futures.Future]) -> None:
+    for future in futures:
+        if future.done() and future.exception() is not None:
+            raise future.exception()
+
+
+def transcribe_chunks(
+    chunks_with_offsets: Iterable[tuple[str, float]],
+    language_hint: Optional[str],
+    diarize: bool,
+) -> list[tuple[float, object]]:
+    client = get_openai_client()
+    log_verbose(f"Transcribing chunks with up to {MAX_CONCURRENT_CHUNK_REQUESTS} concurrent requests")
+    request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_CHUNK_REQUESTS)
+    submitted: list[tuple[float, concurrent.futures.Future]] = []
+    for chunk_path, offset in chunks_with_offsets:
+        request_slots.acquire()
+        raise_first_chunk_error(future for _, future in submitted)
+        print(f"Processing chunk: {os.path.basename(chunk_path)} (offset {offset:.1f}s)")
+        future = start_daemon_task(transcribe_chunk_with_retry, chunk_path, language_hint, diarize, client)
+        future.add_done_callback(lambda _future: request_slots.release())
+        submitted.append((offset, future))
+
+    futures = [future for _, future in submitted]
+    concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+    raise_first_chunk_error(futures)
+    return [(offset, future.result()) for offset, future in submitted]
+
+
 def build_output_header(
     source_context: dict,
     audio_file_path: str,
@@ -1058,6 +1390,21 @@ def summarize_transcript(transcript_text: str, source_context: dict) -> str:
     return format_structured_summary(parsed)
 
 
+def write_text_output(output_path: str, content: str) -> None:
+    output_dir = os.path.dirname(output_path) or "."
+    temp_path = os.path.join(output_dir, f".tmp_{uuid.uuid4().hex}.txt")
+    # Unlike mkstemp's fixed 0600, 0o666 lets the kernel apply the caller's umask.
+    file_descriptor = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as output_file:
+            output_file.write(content)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def write_summary_output(
     source_context: dict,
     transcript_output_path: str,
@@ -1066,22 +1413,20 @@ def write_summary_output(
     summary_text: str,
 ) -> str:
     output_path = build_summary_output_path(source_context, language_hint, diarize)
-    with open(output_path, "w", encoding="utf-8") as output_file:
-        output_file.write(f"\n#########\n{datetime.datetime.now()}\n")
-        output_file.write(f"Transcript source: {transcript_output_path}\n")
-        output_file.write(f"Summary model: {get_summary_model_name()}\n")
-        output_file.write(f"Diarization: {'enabled' if diarize else 'disabled'}\n")
-        output_file.write(f"Language hint: {language_hint or 'auto'}\n")
-        if source_context["source_type"] == "youtube":
-            output_file.write(f"YouTube URL: {source_context['youtube_url']}\n")
-            output_file.write(f"YouTube live status: {source_context['youtube_live_status'] or 'Unknown'}\n")
-            if source_context.get("youtube_live_capture_outcome"):
-                output_file.write(
-                    f"YouTube live capture outcome: {source_context['youtube_live_capture_outcome']}\n"
-                )
-        output_file.write("\nSummary:\n")
-        output_file.write(summary_text)
-        output_file.write("\n")
+    lines = [
+        f"\n#########\n{datetime.datetime.now()}",
+        f"Transcript source: {transcript_output_path}",
+        f"Summary model: {get_summary_model_name()}",
+        f"Diarization: {'enabled' if diarize else 'disabled'}",
+        f"Language hint: {language_hint or 'auto'}",
+    ]
+    if source_context["source_type"] == "youtube":
+        lines.append(f"YouTube URL: {source_context['youtube_url']}")
+        lines.append(f"YouTube live status: {source_context['youtube_live_status'] or 'Unknown'}")
+        if source_context.get("youtube_live_capture_outcome"):
+            lines.append(f"YouTube live capture outcome: {source_context['youtube_live_capture_outcome']}")
+    lines.extend(["", "Summary:", summary_text])
+    write_text_output(output_path, "\n".join(lines) + "\n")
     return output_path
 
 
@@ -1096,23 +1441,51 @@ def write_transcription_output(
 ) -> str:
     output_path = build_transcription_output_path(source_context, language_hint, diarize)
 
-    with open(output_path, "w", encoding="utf-8") as output_file:
-        for line in build_output_header(source_context, audio_file_path, language_hint, diarize):
-            output_file.write(line + "\n")
-        output_file.write("\n")
-        if diarize and transcription and hasattr(transcription, "segments"):
-            output_file.write("Segments:\n")
-            for line in segments_output:
-                output_file.write(line + "\n")
-            output_file.write("\nFull transcript:\n")
-            output_file.write(full_text_output)
-        else:
-            output_file.write(full_text_output)
-        output_file.write("\n\n")
+    parts = ["\n".join(build_output_header(source_context, audio_file_path, language_hint, diarize)), "\n\n"]
+    if diarize and transcription and hasattr(transcription, "segments"):
+        parts.append("Segments:\n")
+        if segments_output:
+            parts.append("\n".join(segments_output))
+            parts.append("\n")
+        parts.append("\nFull transcript:\n")
+    parts.append(full_text_output)
+    parts.append("\n\n")
+    write_text_output(output_path, "".join(parts))
 
     return output_path
 
 
+def is_segment_in_chunk_window(
+    start_time: float,
+    lower_bound: Optional[float],
+    upper_bound: Optional[float],
+    previous_end: Optional[float],
+) -> bool:
+    if lower_bound is not None and start_time < lower_bound:
+        return False
+    if upper_bound is not None and start_time >= upper_bound:
+        return False
+    if previous_end is not None and start_time < previous_end - CHUNK_BOUNDARY_TOLERANCE_SECONDS:
+        return False
+    return True
+
+
+def normalize_overlap_word(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def trim_repeated_leading_words(previous_text: str, text: str) -> str:
+    previous_words = [normalize_overlap_word(word) for word in previous_text.split()]
+    words = text.split()
+    normalized_words = [normalize_overlap_word(word) for word in words]
+    max_overlap = min(MAX_OVERLAP_WORDS, len(previous_words), len(words))
+    for overlap_size in range(max_overlap, MIN_OVERLAP_WORDS - 1, -1):
+        if previous_words[-overlap_size:] == normalized_words[:overlap_size]:
+            log_verbose(f"Dropping {overlap_size} word(s) repeated across the chunk overlap")
+            return " ".join(words[overlap_size:])
+    return text
+
+
 def transcribe_audio_file(
     audio_file_path: str,
     language_hint: Optional[str],
@@ -1127,7 +1500,7 @@ def transcribe_audio_file(
         print(
             f"Audio duration {total_duration:.1f}s exceeds model limit ({MAX_MODEL_DURATION_SECONDS}s). Splitting into chunks."
         )
-        chunk_dir, chunks_with_offsets = split_audio_file(audio_file_path)
+        chunk_dir, chunks_with_offsets = split_audio_file(audio_file_path, total_duration)
     else:
         chunk_dir = None
         chunks_with_offsets = [(audio_file_path, 0.0)]
@@ -1137,24 +1510,45 @@ def transcribe_audio_file(
     transcription = None
 
     try:
-        for chunk_path, offset in chunks_with_offsets:
-            print(f"Processing chunk: {os.path.basename(chunk_path)} (offset {offset:.1f}s)")
-            transcription = transcribe_chunk_with_retry(chunk_path, language_hint, diarize)
-
+        format_ts = format_timestamp
+        results = transcribe_chunks(chunks_with_offsets, language_hint, diarize)
+        chunk_offsets = [offset for offset, _ in results]
+        previous_end: Optional[float] = None
+        previous_text = ""
+        for index, (offset, transcription) in enumerate(results):
+            lower_bound = offset + CHUNK_OVERLAP_SECONDS / 2 if index > 0 else None
+            upper_bound = (
+                chunk_offsets[index + 1] + CHUNK_OVERLAP_SECONDS / 2 if index + 1 < len(results) else None
+            )
             if diarize and hasattr(transcription, "segments"):
+                kept_texts: list[str] = []
+                chunk_end = previous_end
                 for segment in transcription.segments:
                     segment_text = segment.text.strip()
                     start_time = segment.start + offset
                     end_time = segment.end + offset
+                    if not is_segment_in_chunk_window(start_time, lower_bound, upper_bound, previous_end):
+                        log_verbose(f"Dropping segment at {start_time:.2f}s duplicated by chunk overlap")
+                        continue
                     segments_output.append(
-                        f"[{format_timestamp(start_time)} - {format_timestamp(end_time)}] {segment.speaker}: {segment_text}"
+                        f"[{format_ts(start_time)} - {format_ts(end_time)}] {segment.speaker}: {segment_text}"
                     )
-                full_text_parts.append(transcription.text.strip())
+                    kept_texts.append(segment_text)
+                    chunk_end = end_time if chunk_end is None else max(chunk_end, end_time)
+                previous_end = chunk_end
+                if len(results) > 1:
+                    full_text_parts.append(" ".join(text for text in kept_texts if text))
+                else:
+                    full_text_parts.append(transcription.text.strip())
             else:
                 if hasattr(transcription, "text"):
                     text_value = transcription.text.strip()
                 else:
                     text_value = str(transcription).strip()
+                chunk_text = text_value
+                if index > 0:
+                    text_value = trim_repeated_leading_words(previous_text, text_value)
+                previous_text = chunk_text
                 segments_output.append(text_value)
                 full_text_parts.append(text_value)
     finally:
@@ -1171,6 +1565,7 @@ def main() -> None:
     VERBOSE = args.verbose
     validate_args(args)
     log_verbose(f"Parsed CLI args: {args}")
+    warm_openai_connection()
     diarize = args.diarize
     summarize = args.summarize
     live_now = args.live_now
@@ -1179,11 +1574,13 @@ def main() -> None:
     source_type = determine_source_type(args)
     language_hint = normalize_language_hint(args.language)
 
+    audio_preparation = None
     if source_type == "local":
         if args.file:
             selected_source_path = resolve_local_file_path(args.file)
         else:
             selected_source_path = choose_local_file()
+        audio_preparation = start_audio_preparation(selected_source_path)
         if language_hint is None and args.language is None:
             language_hint = prompt_language_hint()
         source_context = {
@@ -1252,7 +1649,10 @@ def main() -> None:
             "youtube_live_capture_outcome": live_capture_outcome,
         }
 
-    audio_file_path = ensure_audio_file(selected_source_path)
+    if audio_preparation is not None:
+        audio_file_path = finish_audio_preparation(audio_preparation)
+    else:
+        audio_file_path = ensure_audio_file(selected_source_path)
     transcript_output_path = build_transcription_output_path(source_context, language_hint, diarize)
     if should_skip_transcription(source_context, transcript_output_path, force_transcribe):
         print(f"Skipping transcription; existing transcript found at {transcript_output_path}")
@@ -1,6 +1,8 @@
 import os
 import io
 import tempfile
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest import mock
@@ -65,6 +67,77 @@ class SpeechTests(unittest.TestCase):
 
         self.assertEqual(api_key, "test-key")
 
+    @mock.patch("speech.OpenAI")
+    def test_openai_clients_share_one_http_connection_pool(self, openai_mock: mock.Mock) -> None:
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=False), mock.patch(
+            "speech._http_client", None
+        ):
+            speech.get_openai_client()
+            speech.get_openai_client()
+
+            first_http_client = openai_mock.call_args_list[0].kwargs["http_client"]
+            second_http_client = openai_mock.call_args_list[1].kwargs["http_client"]
+            self.assertIsNotNone(first_http_client)
+            self.assertIs(first_http_client, second_http_client)
+            self.assertTrue(first_http_client.follow_redirects)
+            first_http_client.close()
+
+    def test_shared_http_client_keeps_idle_connections_alive(self) -> None:
+        with mock.patch("speech._http_client", None), mock.patch("speech.DefaultHttpxClient") as client_mock:
+            speech.get_http_client()
+
+        limits = client_mock.call_args.kwargs["limits"]
+        self.assertEqual(limits.keepalive_expiry, speech.HTTP_KEEPALIVE_EXPIRY_SECONDS)
+        self.assertGreaterEqual(limits.keepalive_expiry, 60.0)
+
+    def test_warm_openai_connection_lists_models_in_background(self) -> None:
+        client_mock = mock.Mock()
+
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=False), mock.patch(
+            "speech.get_openai_client", return_value=client_mock
+        ):
+            thread = speech.warm_openai_connection()
+            self.assertIsNotNone(thread)
+            thread.join(timeout=5)
+
+        self.assertTrue(thread.daemon)
+        client_mock.models.list.assert_called_once_with()
+
+    def test_warm_openai_connection_uses_the_shared_http_client(self) -> None:
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}, clear=False), mock.patch(
+            "speech._http_client", None
+        ), mock.patch("speech.DefaultHttpxClient") as http_client_mock, mock.patch("speech.OpenAI") as openai_mock:
+            thread = speech.warm_openai_connection()
+            thread.join(timeout=5)
+
+        self.assertIs(openai_mock.call_args.kwargs["http_client"], http_client_mock.return_value)
+        openai_mock.return_value.models.list.assert_called_once_with()
+
+    def test_warm_openai_connection_skips_without_api_key(self) -> None:
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": ""}, clear=False), mock.patch(
+            "speech.get_openai_client"
+        ) as get_client_mock:
+            self.assertIsNone(speech.warm_openai_connection())
+
+        get_client_mock.assert_not_called()
+
+    def test_read_int_setting_accepts_values_in_range(self) -> None:
+        with mock.patch.dict(os.environ, {"SPEECH_MAX_RETRIES": " 3 "}, clear=False):
+            self.assertEqual(speech.read_int_setting("SPEECH_MAX_RETRIES", 1, minimum=1), 3)
+        with mock.patch.dict(os.environ, {"SPEECH_MAX_RETRIES": ""}, clear=False):
+            self.assertEqual(speech.read_int_setting("SPEECH_MAX_RETRIES", 1, minimum=1), 1)
+
+    def test_read_int_setting_falls_back_to_default_with_named_warning(self) -> None:
+        for raw_value in ("abc", "0", "2000"):
+            with mock.patch.dict(os.environ, {"SPEECH_CHUNK_OVERLAP_SECONDS": raw_value}, clear=False), mock.patch(
+                "sys.stdout", new_callable=io.StringIO
+            ) as stdout:
+                value = speech.read_int_setting("SPEECH_CHUNK_OVERLAP_SECONDS", 5, minimum=1, maximum=899)
+
+            self.assertEqual(value, 5)
+            self.assertIn("SPEECH_CHUNK_OVERLAP_SECONDS", stdout.getvalue())
+            self.assertIn("using 5", stdout.getvalue())
+
     def test_validate_args_rejects_non_youtube_url(self) -> None:
         args = speech.parse_args(["--url", "https://example.com/video"])
 
@@ -99,6 +172,12 @@ class SpeechTests(unittest.TestCase):
         self.assertEqual(resolved_direct, direct_file)
         self.assertEqual(resolved_nested, nested_file)
 
+    def test_is_supported_local_source_matches_extensions_case_insensitively(self) -> None:
+        self.assertTrue(speech.is_supported_local_source("Meeting.MP4"))
+        self.assertTrue(speech.is_supported_local_source("voice note.Opus"))
+        self.assertFalse(speech.is_supported_local_source("notes.txt"))
+        self.assertFalse(speech.is_supported_local_source("clip.mp3.part"))
+
     def test_recursive_source_discovery_includes_nested_youtube_downloads(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             nested_dir = os.path.join(temp_dir, "youtube")
@@ -320,6 +399,334 @@ class SpeechTests(unittest.TestCase):
         _, kwargs = create_mock.call_args
         self.assertEqual(kwargs["language"], "en")
 
+    def test_transcription_upload_streams_named_file_handle(self) -> None:
+        client_mock = mock.Mock()
+        create_mock = client_mock.audio.transcriptions.create
+        create_mock.return_value = SimpleNamespace(text="hello", segments=[])
+
+        with tempfile.NamedTemporaryFile(suffix=".opus") as temp_audio, mock.patch(
+            "speech.get_openai_client"
+        ) as get_client_mock:
+            speech.transcribe_chunk_with_retry(temp_audio.name, None, diarize=False, client=client_mock)
+
+        get_client_mock.assert_not_called()
+        _, kwargs = create_mock.call_args
+        file_name, file_handle, mime_type = kwargs["file"]
+        self.assertEqual(file_name, os.path.splitext(os.path.basename(temp_audio.name))[0] + ".ogg")
+        self.assertEqual(file_handle.name, temp_audio.name)
+        self.assertEqual(mime_type, "audio/ogg")
+
+    @mock.patch("speech.subprocess.run")
+    def test_get_audio_duration_reuses_probe_until_file_changes(self, run_mock: mock.Mock) -> None:
+        run_mock.return_value = SimpleNamespace(stdout="12.5\n")
+
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.dict(speech._duration_cache, clear=True):
+            audio_path = os.path.join(temp_dir, "clip.mp3")
+            with open(audio_path, "wb") as file_handle:
+                file_handle.write(b"data")
+
+            self.assertEqual(speech.get_audio_duration(audio_path), 12.5)
+            self.assertEqual(speech.get_audio_duration(audio_path), 12.5)
+            self.assertEqual(run_mock.call_count, 1)
+
+            with open(audio_path, "ab") as file_handle:
+                file_handle.write(b"more")
+            speech.get_audio_duration(audio_path)
+
+        self.assertEqual(run_mock.call_count, 2)
+
+    def test_build_upload_file_sends_opus_sources_under_an_ogg_name(self) -> None:
+        audio_file = io.BytesIO(b"OggS")
+
+        self.assertEqual(
+            speech.build_upload_file("/tmp/segments/voice_part_001.OPUS", audio_file),
+            ("voice_part_001.ogg", audio_file, "audio/ogg"),
+        )
+        self.assertEqual(
+            speech.build_upload_file("/media/meeting.m4a", audio_file),
+            ("meeting.m4a", audio_file, "audio/mp4"),
+        )
+
+    def test_build_audio_extraction_command_copies_supported_codecs(self) -> None:
+        command, output_path = speech.build_audio_extraction_command("/media/meeting.mp4", "aac")
+
+        self.assertEqual(output_path, "/media/meeting.m4a")
+        self.assertIn("copy", command)
+        self.assertNotIn("libopus", command)
+
+        command, output_path = speech.build_audio_extraction_command("/media/stream.webm", "opus")
+        self.assertEqual(output_path, "/media/stream.ogg")
+        self.assertIn("copy", command)
+
+    def test_build_audio_extraction_command_transcodes_other_codecs_to_speech_opus(self) -> None:
+        for codec_name in ("pcm_s16le", None):
+            command, output_path = speech.build_audio_extraction_command("/media/clip.mov", codec_name)
+
+            self.assertEqual(output_path, "/media/clip.ogg")
+            self.assertEqual(command[command.index("-c:a") + 1], "libopus")
+            self.assertEqual(command[command.index("-b:a") + 1], "24k")
+            self.assertNotIn("copy", command)
+
+    def test_build_audio_extraction_command_does_not_read_stdin(self) -> None:
+        for codec_name in ("aac", "pcm_s16le"):
+            command, _ = speech.build_audio_extraction_command("/media/clip.mov", codec_name)
+
+            self.assertIn("-nostdin", command)
+
+    @mock.patch("speech.get_audio_duration", return_value=1800.0)
+    @mock.patch("speech.extract_audio_from_media", return_value="./sources/meeting.m4a")
+    def test_start_audio_preparation_extracts_and_probes_in_background(
+        self,
+        extract_mock: mock.Mock,
+        duration_mock: mock.Mock,
+    ) -> None:
+        future, messages = speech.start_audio_preparation("./sources/meeting.mp4")
+
+        self.assertEqual(future.result(timeout=5), "./sources/meeting.m4a")
+        extract_mock.assert_called_once_with("./sources/meeting.mp4", report=messages.append)
+        duration_mock.assert_called_once_with("./sources/meeting.m4a", report=messages.append)
+
+    @mock.patch("speech.subprocess.run", return_value=SimpleNamespace(stdout="aac\n"))
+    def test_audio_probe_verbose_logs_go_through_report(self, _run_mock: mock.Mock) -> None:
+        messages: list[str] = []
+        with mock.patch("speech.VERBOSE", True), mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            codec_name = speech.get_audio_codec("/media/clip.mov", report=messages.append)
+
+        self.assertEqual(codec_name, "aac")
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertTrue(messages)
+        self.assertTrue(all(message.startswith("[verbose] ") for message in messages))
+
+    def test_finish_audio_preparation_prints_held_messages_after_failure(self) -> None:
+        def fail_extraction(media_path: str, report) -> str:
+            report("Error extracting audio: broken stream")
+            raise SystemExit(1)
+
+        with mock.patch("speech.extract_audio_from_media", side_effect=fail_extraction), mock.patch(
+            "sys.stdout", new_callable=io.StringIO
+        ) as stdout:
+            preparation = speech.start_audio_preparation("./sources/meeting.mp4")
+            preparation[0].exception(timeout=5)
+            self.assertEqual(stdout.getvalue(), "")
+
+            with self.assertRaises(SystemExit):
+                speech.finish_audio_preparation(preparation)
+
+        self.assertIn("Error extracting audio: broken stream", stdout.getvalue())
+
+    def test_plan_audio_chunks_uses_overlapping_arithmetic_offsets(self) -> None:
+        plan = speech.plan_audio_chunks(
+            "/audio/long.mp3",
+            "/tmp/segments",
+            total_duration=2000.0,
+            segment_length=900,
+            overlap=5,
+        )
+
+        self.assertEqual(
+            plan,
+            [
+                ("/tmp/segments/long_part_000.mp3", 0.0, 900),
+                ("/tmp/segments/long_part_001.mp3", 895.0, 900),
+                ("/tmp/segments/long_part_002.mp3", 1790.0, 210.0),
+            ],
+        )
+
+    def test_plan_audio_chunks_skips_chunk_already_covered_by_overlap(self) -> None:
+        plan = speech.plan_audio_chunks(
+            "/audio/long.mp3",
+            "/tmp/segments",
+            total_duration=1795.0,
+            segment_length=900,
+            overlap=5,
+        )
+
+        self.assertEqual([start for _, start, _ in plan], [0.0, 895.0])
+
+    @mock.patch("speech.os.path.exists", return_value=True)
+    @mock.patch("speech.subprocess.run")
+    @mock.patch("speech.tempfile.mkdtemp", return_value="/tmp/segments")
+    @mock.patch("speech.get_audio_duration")
+    def test_split_audio_file_derives_offsets_without_probing_chunks(
+        self,
+        duration_mock: mock.Mock,
+        _mkdtemp_mock: mock.Mock,
+        run_mock: mock.Mock,
+        _exists_mock: mock.Mock,
+    ) -> None:
+        temp_dir, chunks = speech.split_audio_file("/audio/long.mp3", 2000.0, segment_length=900, overlap=5)
+
+        self.assertEqual(temp_dir, "/tmp/segments")
+        self.assertEqual([offset for _, offset in chunks], [0.0, 895.0, 1790.0])
+        self.assertEqual(run_mock.call_count, 3)
+        self.assertTrue(all(call.args[0][0] == "ffmpeg" for call in run_mock.call_args_list))
+        duration_mock.assert_not_called()
+
+    def test_build_chunk_command_seeks_before_opening_input(self) -> None:
+        command = speech.build_chunk_command("/audio/long.mp3", "/tmp/segments/long_part_001.mp3", 895.0, 900)
+
+        self.assertLess(command.index("-ss"), command.index("-i"))
+        self.assertEqual(command[-1], "/tmp/segments/long_part_001.mp3")
+
+    @mock.patch("speech.os.path.exists", return_value=True)
+    @mock.patch("speech.subprocess.run")
+    def test_chunks_are_submitted_as_soon_as_each_one_is_cut(
+        self,
+        run_mock: mock.Mock,
+        _exists_mock: mock.Mock,
+    ) -> None:
+        events: list[str] = []
+        first_upload_started = threading.Event()
+        plan = [("/tmp/segments/a_part_000.mp3", 0.0, 900), ("/tmp/segments/a_part_001.mp3", 895.0, 900)]
+
+        def fake_run(command, **_kwargs):
+            if command[-1] == plan[1][0]:
+                first_upload_started.wait(timeout=1.0)
+            events.append(f"cut {os.path.basename(command[-1])}")
+
+        def fake_transcribe(chunk_path, _language_hint, _diarize, _client=None):
+            events.append(f"upload {os.path.basename(chunk_path)}")
+            first_upload_started.set()
+            return SimpleNamespace(text=chunk_path)
+
+        run_mock.side_effect = fake_run
+
+        with mock.patch("speech.get_openai_client"), mock.patch(
+            "speech.transcribe_chunk_with_retry", side_effect=fake_transcribe
+        ), mock.patch("speech.MAX_CONCURRENT_CHUNK_REQUESTS", 1):
+            results = speech.transcribe_chunks(
+                speech.iter_audio_chunks("/audio/a.mp3", "/tmp/segments", plan),
+                None,
+                diarize=False,
+            )
+
+        self.assertEqual([offset for offset, _ in results], [0.0, 895.0])
+        self.assertLess(events.index("upload a_part_000.mp3"), events.index("cut a_part_001.mp3"))
+
+    @mock.patch("speech.shutil.rmtree")
+    @mock.patch("speech.split_audio_file")
+    @mock.patch("speech.get_audio_duration", return_value=3000.0)
+    def test_transcribe_audio_file_keeps_chunk_order_with_concurrent_requests(
+        self,
+        _duration_mock: mock.Mock,
+        split_mock: mock.Mock,
+        _rmtree_mock: mock.Mock,
+    ) -> None:
+        split_mock.return_value = (
+            "segments_tmp",
+            [("part_000.mp3", 0.0), ("part_001.mp3", 895.0), ("part_002.mp3", 1790.0)],
+        )
+        delays = {"part_000.mp3": 0.05, "part_001.mp3": 0.02, "part_002.mp3": 0.0}
+
+        def fake_transcribe(chunk_path, _language_hint, _diarize, _client=None):
+            time.sleep(delays[chunk_path])
+            return SimpleNamespace(text=chunk_path)
+
+        with mock.patch("speech.get_openai_client"), mock.patch(
+            "speech.transcribe_chunk_with_retry", side_effect=fake_transcribe
+        ):
+            _, segments_output, full_text_output = speech.transcribe_audio_file("long.mp3", None, diarize=False)
+
+        split_mock.assert_called_once_with("long.mp3", 3000.0)
+        self.assertEqual(segments_output, ["part_000.mp3", "part_001.mp3", "part_002.mp3"])
+        self.assertEqual(full_text_output, "part_000.mp3\npart_001.mp3\npart_002.mp3")
+
+    def test_transcribe_chunks_stops_early_without_blocking_exit_on_in_flight_uploads(self) -> None:
+        release_slow_upload = threading.Event()
+        upload_threads: list[threading.Thread] = []
+        yielded_chunks: list[str] = []
+
+        def fake_transcribe(chunk_path, _language_hint, _diarize, _client=None):
+            upload_threads.append(threading.current_thread())
+            if chunk_path == "part_000.mp3":
+                raise RuntimeError("upload failed")
+            release_slow_upload.wait(timeout=5)
+            return SimpleNamespace(text=chunk_path)
+
+        def chunks():
+            for index in range(6):
+                yielded_chunks.append(f"part_{index:03d}.mp3")
+                yield f"part_{index:03d}.mp3", index * 895.0
+
+        started_at = time.monotonic()
+        try:
+            with mock.patch("speech.get_openai_client"), mock.patch(
+                "speech.transcribe_chunk_with_retry", side_effect=fake_transcribe
+            ), mock.patch("speech.MAX_CONCURRENT_CHUNK_REQUESTS", 2):
+                with self.assertRaises(RuntimeError):
+                    speech.transcribe_chunks(chunks(), None, diarize=False)
+            elapsed = time.monotonic() - started_at
+        finally:
+            release_slow_upload.set()
+
+        self.assertLess(elapsed, 2.0)
+        self.assertLess(len(yielded_chunks), 6)
+        self.assertTrue(upload_threads)
+        self.assertTrue(all(thread.daemon for thread in upload_threads))
+
+    @mock.patch("speech.shutil.rmtree")
+    @mock.patch("speech.split_audio_file")
+    @mock.patch("speech.get_audio_duration", return_value=1700.0)
+    def test_transcribe_audio_file_drops_diarized_segments_repeated_in_overlap(
+        self,
+        _duration_mock: mock.Mock,
+        split_mock: mock.Mock,
+        _rmtree_mock: mock.Mock,
+    ) -> None:
+        split_mock.return_value = ("segments_tmp", [("part_000.mp3", 0.0), ("part_001.mp3", 895.0)])
+
+        def segment(start, end, speaker, text):
+            return SimpleNamespace(start=start, end=end, speaker=speaker, text=text)
+
+        transcriptions = {
+            "part_000.mp3": SimpleNamespace(
+                text="intro closing words",
+                segments=[
+                    segment(0.0, 890.0, "A", "intro"),
+                    segment(894.0, 898.5, "B", "closing words"),
+                ],
+            ),
+            "part_001.mp3": SimpleNamespace(
+                text="closing words next topic",
+                segments=[
+                    segment(0.2, 3.4, "B", "closing words"),
+                    segment(3.6, 20.0, "A", "next topic"),
+                ],
+            ),
+        }
+
+        with mock.patch("speech.get_openai_client"), mock.patch(
+            "speech.transcribe_chunk_with_retry",
+            side_effect=lambda chunk_path, *_args: transcriptions[chunk_path],
+        ), mock.patch("speech.CHUNK_OVERLAP_SECONDS", 5):
+            _, segments_output, full_text_output = speech.transcribe_audio_file("long.mp3", None, diarize=True)
+
+        self.assertEqual(
+            segments_output,
+            [
+                "[00:00:00.000 - 00:14:50.000] A: intro",
+                "[00:14:54.000 - 00:14:58.500] B: closing words",
+                "[00:14:58.600 - 00:15:15.000] A: next topic",
+            ],
+        )
+        self.assertEqual(full_text_output, "intro closing words\nnext topic")
+
+    def test_trim_repeated_leading_words_removes_overlap_text(self) -> None:
+        self.assertEqual(
+            speech.trim_repeated_leading_words("we shipped the new release today.", "Release today. Next, the roadmap."),
+            "Next, the roadmap.",
+        )
+        self.assertEqual(
+            speech.trim_repeated_leading_words("we shipped the new release", "the roadmap comes next"),
+            "the roadmap comes next",
+        )
+
+    def test_format_timestamp_renders_hours_minutes_and_milliseconds(self) -> None:
+        self.assertEqual(speech.format_timestamp(0), "00:00:00.000")
+        self.assertEqual(speech.format_timestamp(59.9996), "00:00:59.999")
+        self.assertEqual(speech.format_timestamp(3723.5), "01:02:03.500")
+        self.assertEqual(speech.format_timestamp(36000.25), "10:00:00.250")
+
     def test_build_transcription_output_path_adds_config_tags(self) -> None:
         output_path = speech.build_transcription_output_path(
             {
@@ -344,6 +751,83 @@ class SpeechTests(unittest.TestCase):
 
         self.assertTrue(output_path.endswith("Test [abc123]__plain__lang-en__summary.txt"))
 
+    def test_write_transcription_output_renders_segments_then_full_transcript(self) -> None:
+        source_context = {"source_type": "local", "selected_source_path": "./sources/clip.mp3"}
+
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch("speech.OUTPUT_DIR", temp_dir), mock.patch(
+            "speech.build_output_header", return_value=["Header one", "Header two"]
+        ):
+            output_path = speech.write_transcription_output(
+                source_context,
+                "./sources/clip.mp3",
+                None,
+                True,
+                SimpleNamespace(segments=[]),
+                ["[00:00:00.000 - 00:00:01.000] A: hi", "[00:00:01.000 - 00:00:02.000] B: hello"],
+                "hi\nhello",
+            )
+            with open(output_path, "r", encoding="utf-8") as file_handle:
+                content = file_handle.read()
+
+        self.assertEqual(
+            content,
+            "Header one\nHeader two\n\n"
+            "Segments:\n"
+            "[00:00:00.000 - 00:00:01.000] A: hi\n"
+            "[00:00:01.000 - 00:00:02.000] B: hello\n"
+            "\nFull transcript:\n"
+            "hi\nhello\n\n",
+        )
+
+    def test_write_summary_output_replaces_file_without_leaving_temp_files(self) -> None:
+        source_context = {
+            "source_type": "youtube",
+            "selected_source_path": "./sources/youtube/Test [abc123].mp3",
+            "youtube_url": "https://www.youtube.com/watch?v=abc123",
+            "youtube_live_status": "not_live",
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch("speech.OUTPUT_DIR", temp_dir):
+            output_path = speech.build_summary_output_path(source_context, "en", False)
+            with open(output_path, "w", encoding="utf-8") as file_handle:
+                file_handle.write("stale")
+
+            written_path = speech.write_summary_output(
+                source_context,
+                "./output/transcript.txt",
+                "en",
+                False,
+                "Overview\nShort.",
+            )
+            with open(written_path, "r", encoding="utf-8") as file_handle:
+                content = file_handle.read()
+            leftover_files = sorted(os.listdir(temp_dir))
+
+        self.assertEqual(written_path, output_path)
+        self.assertEqual(leftover_files, [os.path.basename(output_path)])
+        self.assertTrue(content.startswith("\n#########\n"))
+        self.assertIn("Transcript source: ./output/transcript.txt\n", content)
+        self.assertTrue(content.endswith("YouTube live status: not_live\n\nSummary:\nOverview\nShort.\n"))
+
+    def test_write_text_output_applies_process_umask(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "transcript.txt")
+            original_umask = os.umask(0o077)
+            try:
+                speech.write_text_output(output_path, "private")
+                private_mode = os.stat(output_path).st_mode & 0o777
+
+                os.umask(0o022)
+                speech.write_text_output(output_path, "shared")
+                shared_mode = os.stat(output_path).st_mode & 0o777
+            finally:
+                os.umask(original_umask)
+            leftover_files = os.listdir(temp_dir)
+
+        self.assertEqual(private_mode, 0o600)
+        self.assertEqual(shared_mode, 0o644)
+        self.assertEqual(leftover_files, ["transcript.txt"])
+
     def test_should_skip_transcription_for_existing_youtube_output(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             output_path = os.path.join(temp_dir, "existing.txt")